@@ -1,10 +1,16 @@
+import logging
 import os
 import sys
+import threading
 import time
-from typing import Dict, List
+from collections import deque
+from typing import Dict, Iterator, List
 import argparse
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
 from dotenv import load_dotenv
 
@@ -16,6 +22,8 @@ class Config:
         self.API_VERSION = ""
         self.API_BASE_URL = ""
         self.SNYK_TOKEN = ""
+        self.CONCURRENCY = 10
+        self.MAX_RPM = 0
         self.TARGETS_JSON_FILE = "targets.json"
         self.FAILED_TARGETS_JSON_FILE = "failed_targets.json"
         self.SUCCESSFUL_TARGETS_JSON_FILE = "successful_targets.json"
@@ -25,11 +33,15 @@ class Config:
         parser.add_argument("--org-id", required=True, help="Snyk Organization ID")
         parser.add_argument("--api-version", default="2025-11-05", help="Snyk API version")
         parser.add_argument("--api-base-url", default="https://api.snyk.io", help="Snyk API base URL")
+        parser.add_argument("--concurrency", type=int, default=10, help="Number of targets deleted in parallel (values above ~10 risk HTTP 429 rate limiting)")
+        parser.add_argument("--max-rpm", type=int, default=0, help="Maximum API requests per minute across all workers (0 = unlimited)")
         args = parser.parse_args()
 
         self.ORG_ID = args.org_id
         self.API_VERSION = args.api_version
         self.API_BASE_URL = args.api_base_url
+        self.CONCURRENCY = args.concurrency
+        self.MAX_RPM = args.max_rpm
         self.SNYK_TOKEN = os.getenv("SNYK_TOKEN")
         
 
@@ -41,56 +53,149 @@ class Config:
             missing_vars.append("ORG_ID")
         if missing_vars:
             raise ValueError(f"Missing required configuration variables: {', '.join(missing_vars)}")
+        if self.CONCURRENCY < 1:
+            raise ValueError("--concurrency must be greater than or equal to 1")
+        if self.MAX_RPM < 0:
+            raise ValueError("--max-rpm must be greater than or equal to 0")
+
+
+class RateLimiter:
+    """Sliding one-minute window shared by all worker threads."""
+
+    WINDOW_SECONDS = 60
+
+    def __init__(self, max_per_minute: int) -> None:
+        self.max_per_minute = max_per_minute
+        self.timestamps = deque()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if not self.max_per_minute:
+            return
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                while self.timestamps and now - self.timestamps[0] >= self.WINDOW_SECONDS:
+                    self.timestamps.popleft()
+
+                if len(self.timestamps) < self.max_per_minute:
+                    self.timestamps.append(now)
+                    return
+
+                wait = self.WINDOW_SECONDS - (now - self.timestamps[0])
+
+            time.sleep(wait)
+
+
+class RateLimitedRetry(Retry):
+    """Retry that takes a rate limiter slot before every automatic resend."""
+
+    def sleep(self, response=None):
+        super().sleep(response)
+        rate_limiter.acquire()
 
 
 console = Console()
 
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to the stream's own buffering."""
+
+    def flush(self):
+        pass
+
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+# Non-interactive stdout is block-buffered, so skip the per-record flush there
+log.addHandler(logging.StreamHandler(sys.stdout) if sys.stdout.isatty() else BufferedStreamHandler(sys.stdout))
+
+PROGRESS_INTERVAL = 100
+# Largest page size accepted by the Snyk REST API
+PAGE_SIZE = 100
+
 config = Config()
 config.load()
 config.validate()
 
 
-def get_headers():
-    return {
+def create_session() -> requests.Session:
+    session = requests.Session()
+    # Accept-Encoding is left to requests, which adds "br" when Brotli is installed
+    session.headers.update({
         "Authorization": f"token {config.SNYK_TOKEN}",
         "Content-Type": "application/json",
-    }
-
-
-def load_targets() -> List[Dict]:
-    url = f"{config.API_BASE_URL}/rest/orgs/{config.ORG_ID}/targets?version={config.API_VERSION}&exclude_empty=false&limit=100"
+    })
+    adapter = HTTPAdapter(
+        pool_connections=config.CONCURRENCY,
+        pool_maxsize=config.CONCURRENCY,
+        max_retries=RateLimitedRetry(
+            total=8,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "DELETE"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+rate_limiter = RateLimiter(config.MAX_RPM)
+session = create_session()
+
+TARGETS_URL_PREFIX = f"{config.API_BASE_URL}/rest/orgs/{config.ORG_ID}/targets"
+VERSION_QS = f"?version={config.API_VERSION}"
+TARGETS_PAGE_URL = f"{TARGETS_URL_PREFIX}{VERSION_QS}&exclude_empty=false&limit={PAGE_SIZE}"
+DELETE_TARGET_URL = (TARGETS_URL_PREFIX + "/{}" + VERSION_QS).format
+
+
+def iter_target_pages() -> Iterator[List[Dict]]:
+    url = TARGETS_PAGE_URL
 
-    targets = []
     has_next = True
 
     while has_next:
         try:
-            response = requests.get(
-                url, headers=get_headers(), timeout=30
-            )
+            rate_limiter.acquire()
+            response = session.get(url, timeout=30)
             response.raise_for_status()
-            
-            targets.extend(response.json().get("data", []))
-            next_url = response.json().get("links", {}).get("next")
-            has_next = next_url is not None
 
-            url = f"{config.API_BASE_URL}{next_url}"
+            payload = orjson.loads(response.content)
+            page = payload.get("data", [])
+            next_url = payload.get("links", {}).get("next")
+            if next_url:
+                url = f"{config.API_BASE_URL}{next_url}"
+            has_next = bool(next_url)
 
         except Exception as e:
             raise ValueError(f"Error fetching targets: {e}")
 
-    return targets
+        yield page
 
 
-def delete_target(target) -> bool:
+def get_retry_after(response) -> float:
     try:
-        target_id = target["id"]
-        url = f"{config.API_BASE_URL}/rest/orgs/{config.ORG_ID}/targets/{target_id}"
-        params = {"version": config.API_VERSION}
+        return max(float(response.headers.get("Retry-After", "1")), 0)
+    except ValueError:
+        return 1
+
+
+def delete_target(target_id: str) -> bool:
+    try:
+        url = DELETE_TARGET_URL(target_id)
+
+        rate_limiter.acquire()
+        response = session.delete(url, timeout=30)
+
+        if response.status_code == 429:
+            time.sleep(get_retry_after(response))
+            rate_limiter.acquire()
+            response = session.delete(url, timeout=30)
 
-        response = requests.delete(
-            url, headers=get_headers(), params=params, timeout=30
-        )
         response.raise_for_status()
 
         return 200 <= response.status_code < 300, None
@@ -98,46 +203,78 @@ def delete_target(target) -> bool:
         return False, e
 
 
+class JsonArrayWriter:
+    """Write a JSON array to disk one element at a time."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.count = 0
+        self.file = None
+
+    def __enter__(self):
+        self.file = open(self.path, "wb")
+        self.file.write(b"[")
+        return self
+
+    def write(self, item: Dict):
+        self.file.write(b",\n  " if self.count else b"\n  ")
+        self.file.write(orjson.dumps(item))
+        self.count += 1
+
+    def __exit__(self, *exc_info):
+        self.file.write(b"\n]\n" if self.count else b"]\n")
+        self.file.close()
+
+
 def main():
     console.print(f"Starting bulk target deletion for org: [bold cyan]{config.ORG_ID}[/bold cyan]\n")
 
-    targets = []
-    successful = 0
-    failed = 0
-
-    targets = load_targets()
-    successful_targets = []
-    failed_targets = []
-
-    for target in targets:
-        target_id = target["id"]
-        target_name = target["attributes"]["display_name"]
-
-        console.print(f"Deleting target: {target_name} ({target_id})")
-
-        success, error = delete_target(target)
-        if success:
-            console.print(f"✅ Successfully deleted target: {target_name} ({target_id})")
-            successful += 1
-            successful_targets.append(target)
-        else:
-            console.print(f"❌ Failed to delete target: {target_name} ({target_id})")
-            console.print(f"Error: {error}")
-            failed += 1
-            failed_targets.append(target)
-
-    with open(config.TARGETS_JSON_FILE, "w", encoding="utf-8") as f:
-        json.dump(targets, f, ensure_ascii=False, indent=2)
-    with open(config.SUCCESSFUL_TARGETS_JSON_FILE, "w", encoding="utf-8") as f:
-        json.dump(successful_targets, f, ensure_ascii=False, indent=2)
-    with open(config.FAILED_TARGETS_JSON_FILE, "w", encoding="utf-8") as f:
-        json.dump(failed_targets, f, ensure_ascii=False, indent=2)
+    pages = iter_target_pages()
+    interactive = sys.stdout.isatty()
+
+    with JsonArrayWriter(config.TARGETS_JSON_FILE) as targets_file, \
+            JsonArrayWriter(config.SUCCESSFUL_TARGETS_JSON_FILE) as successful_file, \
+            JsonArrayWriter(config.FAILED_TARGETS_JSON_FILE) as failed_file:
+        with ThreadPoolExecutor(max_workers=1) as prefetcher, ThreadPoolExecutor(max_workers=config.CONCURRENCY) as executor:
+            next_page = prefetcher.submit(next, pages, None)
+
+            while True:
+                page = next_page.result()
+                if page is None:
+                    break
+
+                # Exactly one page remaining: pre-fetch the next page while this one is being deleted
+                next_page = prefetcher.submit(next, pages, None)
+
+                ids = [target["id"] for target in page]
+                names = [target["attributes"]["display_name"] for target in page]
+                futures = {executor.submit(delete_target, target_id): i for i, target_id in enumerate(ids)}
+
+                for future in as_completed(futures):
+                    i = futures[future]
+                    target, target_id, target_name = page[i], ids[i], names[i]
+                    targets_file.write(target)
+
+                    success, error = future.result()
+                    if success:
+                        if interactive:
+                            log.info(f"✅ Successfully deleted target: {target_name} ({target_id})")
+                        successful_file.write(target)
+                    else:
+                        log.error(f"❌ Failed to delete target: {target_name} ({target_id})")
+                        log.error(f"Error: {error}")
+                        failed_file.write(target)
+
+                    if not interactive and targets_file.count % PROGRESS_INTERVAL == 0:
+                        log.info(f"Processed {targets_file.count} targets")
+
+    failed = failed_file.count
 
     console.print(f"\n{'=' * 50}")
     console.print("[bold white]SUMMARY[/bold white]")
     console.print(f"{'=' * 50}")
-    console.print(f"Total targets: [bold yellow]{len(targets)}[/bold yellow] [bold white]{config.TARGETS_JSON_FILE}[/bold white]")
-    console.print(f"Successfully deleted: [bold green]{successful}[/bold green] [bold white]{config.SUCCESSFUL_TARGETS_JSON_FILE}[/bold white]")
+    console.print(f"Total targets: [bold yellow]{targets_file.count}[/bold yellow] [bold white]{config.TARGETS_JSON_FILE}[/bold white]")
+    console.print(f"Successfully deleted: [bold green]{successful_file.count}[/bold green] [bold white]{config.SUCCESSFUL_TARGETS_JSON_FILE}[/bold white]")
     console.print(f"Failed: [bold red]{failed}[/bold red] [bold white]{config.FAILED_TARGETS_JSON_FILE}[/bold white]")
     console.print(f"{'=' * 50}\n")
 
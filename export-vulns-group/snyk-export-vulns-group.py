@@ -6,27 +6,52 @@ This script exports all vulnerabilities from the Snyk Export API for a given gro
 saves the results as JSON and CSV files.
 """
 import csv
+import gc
+import gzip
+import io
 import shutil
 import os
 import sys
 import json
 import logging
+import logging.handlers
 import argparse
+import atexit
+import queue
+import random
 import re
-import subprocess
-from collections import defaultdict
-from datetime import datetime
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import date, datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import IO, Optional
 
+import certifi
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module
+    orjson = None
+
+# Decode JSON from raw response bytes; json.loads accepts bytes too, which skips requests' charset detection
+_loads = orjson.loads if orjson else json.loads
+
 load_dotenv()
 
+# Characters not allowed in output file names
+_UNSAFE_FN = re.compile(r'[<>:"/\\|?*]')
+# Lower-cased ISSUE_SEVERITY -> index into the per-org [CRITICAL, HIGH, MEDIUM, LOW] counts
+SEV_IDX = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
 
 class Config:
     """Configuration class to hold all script parameters."""
@@ -40,6 +65,14 @@ class Config:
         self.API_URL: str = "https://api.snyk.io"
         self.API_VERSION: str = "2024-10-15"
         self.SNYK_TOKEN: str = ""
+        self.PRETTY_JSON: bool = False
+        self.COMPRESS_OUTPUT: bool = False
+        # Derived from the values above in load(), so they are built once per run
+        self._date_from_iso: str = ""
+        self._date_to_iso: str = ""
+        self._headers: dict = {}
+        self._export_url: str = ""
+        self._status_url: str = ""
 
     def load(self) -> None:
         """Load configuration from command line arguments and environment variables."""
@@ -86,6 +119,16 @@ class Config:
             action="store_true",
             help="At the end, run a Streamlit page to view vulnerability charts by org and severity"
         )
+        parser.add_argument(
+            "--pretty-json",
+            action="store_true",
+            help="Write result.json indented for readability (default: the raw API response)"
+        )
+        parser.add_argument(
+            "--compress-output",
+            action="store_true",
+            help="Gzip result.json and issues-*.csv (written as .json.gz / .csv.gz)"
+        )
 
         args = parser.parse_args()
 
@@ -98,6 +141,15 @@ class Config:
         self.API_URL = args.api_url
         self.API_VERSION = args.api_version
         self.SNYK_TOKEN = os.getenv("SNYK_TOKEN", "")
+        self.PRETTY_JSON = args.pretty_json
+        self.COMPRESS_OUTPUT = args.compress_output
+
+        self._date_from_iso = f"{self.DATE_FROM}T00:00:00Z"
+        self._date_to_iso = f"{self.DATE_TO}T23:59:59Z"
+        self._headers = get_headers(self.SNYK_TOKEN)
+        self._export_url = f"{self.API_URL}/rest/groups/{self.GROUP_ID}/export?version={self.API_VERSION}"
+        # Formatted with the export ID
+        self._status_url = f"{self.API_URL}/rest/groups/{self.GROUP_ID}/jobs/export/{{}}?version={self.API_VERSION}"
 
     def validate(self) -> None:
         """Validate that all required configuration is present and correctly formatted."""
@@ -111,55 +163,68 @@ class Config:
         if not self.GROUP_ID:
             errors.append("--group-id is required")
 
-        # Validate date format (YYYY-MM-DD)
-        date_pattern = r"^\d{4}-\d{2}-\d{2}$"
-        
-        if not self.DATE_FROM:
-            errors.append("--date-from is required")
-        elif not re.match(date_pattern, self.DATE_FROM):
-            errors.append(f"--date-from must be in YYYY-MM-DD format, got: {self.DATE_FROM}")
-        else:
-            # Validate it's a valid date
-            try:
-                datetime.strptime(self.DATE_FROM, "%Y-%m-%d")
-            except ValueError:
-                errors.append(f"--date-from is not a valid date: {self.DATE_FROM}")
-
-        if not self.DATE_TO:
-            errors.append("--date-to is required")
-        elif not re.match(date_pattern, self.DATE_TO):
-            errors.append(f"--date-to must be in YYYY-MM-DD format, got: {self.DATE_TO}")
-        else:
-            # Validate it's a valid date
-            try:
-                datetime.strptime(self.DATE_TO, "%Y-%m-%d")
-            except ValueError:
-                errors.append(f"--date-to is not a valid date: {self.DATE_TO}")
+        # Validate dates (YYYY-MM-DD)
+        from_date = self._parse_date("--date-from", self.DATE_FROM, errors)
+        to_date = self._parse_date("--date-to", self.DATE_TO, errors)
 
         # Validate date range
-        if self.DATE_FROM and self.DATE_TO:
-            try:
-                from_date = datetime.strptime(self.DATE_FROM, "%Y-%m-%d")
-                to_date = datetime.strptime(self.DATE_TO, "%Y-%m-%d")
-                if from_date > to_date:
-                    errors.append("--date-from must be before or equal to --date-to")
-            except ValueError:
-                pass  # Already reported above
+        if from_date and to_date and from_date > to_date:
+            errors.append("--date-from must be before or equal to --date-to")
 
         if errors:
             raise ValueError("\n".join(errors))
 
+    @staticmethod
+    def _parse_date(option: str, value: str, errors: list[str]) -> Optional[date]:
+        """Parse a YYYY-MM-DD date argument, appending to errors and returning None if invalid."""
+        if not value:
+            errors.append(f"{option} is required")
+            return None
+        try:
+            parsed = date.fromisoformat(value)
+        except ValueError:
+            parsed = None
+        # fromisoformat also accepts other ISO 8601 forms (e.g. 20250101) on Python 3.11+
+        if parsed is None or parsed.isoformat() != value:
+            errors.append(f"{option} must be a valid date in YYYY-MM-DD format, got: {value}")
+            return None
+        return parsed
+
     def get_date_from_iso(self) -> str:
         """Convert DATE_FROM to ISO format with time 00:00:00Z."""
-        return f"{self.DATE_FROM}T00:00:00Z"
+        return self._date_from_iso
 
     def get_date_to_iso(self) -> str:
         """Convert DATE_TO to ISO format with time 23:59:59Z."""
-        return f"{self.DATE_TO}T23:59:59Z"
+        return self._date_to_iso
 
 
 console = Console()
 
+# Maximum number of CSV files downloaded in parallel
+MAX_DOWNLOAD_WORKERS = 16
+# Chunk size used when streaming CSV files to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Optional CA bundle (e.g. for a TLS-intercepting proxy); when unset, API calls and downloads both use certifi's bundle
+SNYK_CA_BUNDLE = os.getenv("SNYK_CA_BUNDLE") or None
+# Connection pool for CSV downloads; these are large binary bodies, so they bypass requests
+download_http = urllib3.PoolManager(
+    num_pools=4,
+    maxsize=MAX_DOWNLOAD_WORKERS,
+    # urllib3 alone would use the system CA store; match requests, which uses certifi
+    ca_certs=SNYK_CA_BUNDLE or certifi.where(),
+    # CSV compresses well; urllib3 decodes the body as it is read, so files land on disk as plain CSV
+    headers=urllib3.util.make_headers(accept_encoding=True),
+    retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False),
+)
+# Export status polling delay: starts at the initial value and doubles up to the maximum
+POLL_INITIAL_DELAY = 1.0
+POLL_MAX_DELAY = 30.0
+# Buffer size for reading and writing result files
+FILE_BUFFER_SIZE = 4 * 1024 * 1024
+# gzip level for --compress-output; level 1 keeps compression cheaper than the disk write
+GZIP_LEVEL = 1
+
 
 def setup_logging(output_folder: str) -> logging.Logger:
     """Setup logging to both console and file."""
@@ -182,7 +247,14 @@ def setup_logging(output_folder: str) -> logging.Logger:
         datefmt="%Y-%m-%d %H:%M:%S"
     )
     file_handler.setFormatter(file_format)
-    logger.addHandler(file_handler)
+
+    # Log calls only enqueue the record; a background thread does the file writes
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    # Flush queued records to the file on exit; logging closes the handler afterwards
+    atexit.register(listener.stop)
 
     return logger
 
@@ -195,29 +267,62 @@ def get_headers(token: str) -> dict:
     }
 
 
-def clear_output_folder(output_folder: str, logger: logging.Logger) -> None:
-    """Clear the output folder."""
+def create_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all Snyk API calls.
+    
+    The Snyk token is passed per API call rather than set on the session.
+    """
+    session = requests.Session()
+    # Set once on the session so every pooled connection shares the same TLS settings
+    session.verify = SNYK_CA_BUNDLE or True
+    # API calls are sequential, so the default pool size is enough.
+    # Only GETs are retried on 429/5xx: a resent POST /export could start a duplicate job
+    # (connection errors are still retried for every method, as nothing was sent).
+    adapter = HTTPAdapter(
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def clear_output_folder(output_folder: str) -> None:
+    """
+    Clear the output folder, creating it if missing.
+    
+    Must run before setup_logging, which opens the log file in this folder,
+    so failures are reported on the console.
+    """
     if os.path.exists(output_folder):
-        for filename in os.listdir(output_folder):
-            file_path = os.path.join(output_folder, filename)
-            try:
-                if os.path.isfile(file_path) or os.path.islink(file_path):
-                    os.unlink(file_path)
-                elif os.path.isdir(file_path):
-                    shutil.rmtree(file_path)
-            except Exception as e:
-                logger.warning(f"Failed to delete {file_path}: {e}")
+        # Entries are removed one by one (rather than rmtree on the folder itself) so a
+        # symlinked output folder is emptied and kept
+        with os.scandir(output_folder) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+                except Exception as e:
+                    console.print(f"[yellow]Warning:[/yellow] Failed to delete {entry.path}: {e}")
     else:
         os.makedirs(output_folder, exist_ok=True)
 
 
-def start_export(config: Config, logger: logging.Logger) -> str:
+def start_export(config: Config, session: requests.Session, logger: logging.Logger) -> str:
     """
     Start the export job by calling the Snyk Export API.
     
     Returns the export job ID.
     """
-    url = f"{config.API_URL}/rest/groups/{config.GROUP_ID}/export?version={config.API_VERSION}"
+    url = config._export_url
     
     filters: dict = {
         "introduced": {
@@ -265,16 +370,15 @@ def start_export(config: Config, logger: logging.Logger) -> str:
         logger.debug(f"Filtering by orgs: {config.ORG_IDS}")
 
     try:
-        response = requests.post(
+        response = session.post(
             url,
-            headers=get_headers(config.SNYK_TOKEN),
+            headers=config._headers,
             json=payload,
-            timeout=60,
-            verify=False
+            timeout=60
         )
         response.raise_for_status()
         
-        data = response.json()
+        data = _loads(response.content)
         export_id = data["data"]["id"]
         
         logger.info(f"Export job started successfully with ID: {export_id}")
@@ -292,24 +396,36 @@ def start_export(config: Config, logger: logging.Logger) -> str:
         raise
 
 
-def check_export_status(config: Config, export_id: str, logger: logging.Logger) -> Optional[dict]:
+def check_export_status(
+    config: Config, session: requests.Session, export_id: str, logger: logging.Logger
+) -> Optional[tuple[dict, bytes]]:
     """
     Check the status of an export job.
     
-    Returns the full response data if the job is FINISHED, None otherwise.
+    Returns the parsed response data and the raw response body if the job is FINISHED, None otherwise.
     """
-    url = f"{config.API_URL}/rest/groups/{config.GROUP_ID}/jobs/export/{export_id}?version={config.API_VERSION}"
+    url = config._status_url.format(export_id)
     
     try:
-        response = requests.get(
+        response = session.get(
             url,
-            headers=get_headers(config.SNYK_TOKEN),
-            timeout=60,
-            verify=False
+            headers=config._headers,
+            timeout=60
         )
         response.raise_for_status()
         
-        data = response.json()
+        # Only a finished or failed job needs the full parse; a byte scan is enough to rule both out
+        body = response.content
+        if b'"FINISHED"' not in body and b'"ERRORED"' not in body:
+            logger.debug("Export job status: not finished yet")
+            return None
+        
+        # The FINISHED payload can list many results; keep GC passes out of the parse
+        gc.disable()
+        try:
+            data = _loads(body)
+        finally:
+            gc.enable()
         status = data.get("data", {}).get("attributes", {}).get("status", "")
         
         logger.debug(f"Export job status: {status}")
@@ -321,7 +437,7 @@ def check_export_status(config: Config, export_id: str, logger: logging.Logger)
             sys.exit(1)
         
         if status == "FINISHED":
-            return data
+            return data, body
         
         return None
 
@@ -334,44 +450,71 @@ def check_export_status(config: Config, export_id: str, logger: logging.Logger)
         raise
 
 
-def wait_for_export(config: Config, export_id: str, logger: logging.Logger) -> dict:
+def wait_for_export(
+    config: Config, session: requests.Session, export_id: str, logger: logging.Logger
+) -> tuple[dict, bytes]:
     """
     Wait for the export job to complete by polling the status endpoint.
     
-    Returns the final response data when the job is FINISHED.
+    Returns the final response data and raw response body when the job is FINISHED.
     """
     logger.info(f"Waiting for export job {export_id} to complete...")
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task(
-            "[cyan]Waiting for export to complete...",
-            total=None
-        )
-        
+    # A plain spinner: the per-poll detail goes to the log file instead of the terminal
+    with console.status("[cyan]Waiting for export to complete..."):
         poll_count = 0
+        delay = POLL_INITIAL_DELAY
         while True:
             poll_count += 1
-            progress.update(task, description=f"[cyan]Checking export status (attempt {poll_count})...")
+            logger.debug(f"Checking export status (attempt {poll_count})")
             
-            result = check_export_status(config, export_id, logger)
+            result = check_export_status(config, session, export_id, logger)
             
             if result is not None:
                 logger.info("Export job completed successfully")
-                progress.update(task, description="[green]Export completed!")
                 return result
             
-            # Wait 1 second before next poll
-            import time
-            time.sleep(1)
+            # Back off exponentially, with jitter, before the next poll
+            time.sleep(delay + random.uniform(0, 0.25 * delay))
+            delay = min(delay * 2, POLL_MAX_DELAY)
+
+
+def download_csv_file(url: str, filepath: Path, file_size: int = 0) -> None:
+    """
+    Stream a single CSV file from url to filepath.
+    
+    When the expected file_size is known, the file is preallocated first (where supported).
+    """
+    response = download_http.request(
+        "GET", url, preload_content=False, timeout=urllib3.Timeout(connect=10, read=300)
+    )
+    try:
+        if response.status >= 400:
+            raise urllib3.exceptions.HTTPError(f"{response.status} {response.reason} for url: {url}")
+        try:
+            with open(filepath, "wb", buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                preallocated = False
+                if hasattr(os, "posix_fallocate") and isinstance(file_size, int) and file_size > 0:
+                    try:
+                        os.posix_fallocate(f.fileno(), 0, file_size)
+                        preallocated = True
+                    except OSError:
+                        pass  # Not supported by this filesystem; just stream
+                shutil.copyfileobj(response, f, length=DOWNLOAD_CHUNK_SIZE)
+                if preallocated:
+                    # fallocate sets the file size; cut it back if fewer bytes arrived
+                    f.truncate()
+        except Exception:
+            # Don't leave a truncated CSV behind for the results review
+            filepath.unlink(missing_ok=True)
+            raise
+    finally:
+        response.release_conn()
 
 
 def download_csv_files(results: list, output_folder: str, logger: logging.Logger) -> int:
     """
-    Download all CSV files from the export results.
+    Download all CSV files from the export results in parallel.
     
     Returns the number of files downloaded.
     """
@@ -379,45 +522,41 @@ def download_csv_files(results: list, output_folder: str, logger: logging.Logger
     downloaded = 0
     
     logger.info(f"Downloading {len(results)} CSV file(s)...")
+
+    workers = max(1, min(MAX_DOWNLOAD_WORKERS, len(results)))
     
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
-    ) as progress:
+    ) as progress, ThreadPoolExecutor(max_workers=workers) as executor:
         task = progress.add_task(
             "[cyan]Downloading CSV files...",
             total=len(results)
         )
         
+        futures = {}
         for idx, result in enumerate(results, start=1):
             url = result.get("url")
-            file_size = result.get("file_size", 0)
-            row_count = result.get("row_count", 0)
             
             if not url:
                 logger.warning(f"Skipping result {idx}: no URL provided")
                 continue
             
             filename = f"csv_{idx}.csv"
-            filepath = output_path / filename
-            
-            progress.update(
-                task,
-                description=f"[cyan]Downloading {filename} ({row_count} rows, {file_size} bytes)..."
-            )
+            file_size = result.get("file_size", 0)
+            future = executor.submit(download_csv_file, url, output_path / filename, file_size)
+            futures[future] = (filename, result.get("row_count", 0), file_size)
+
+        for future in as_completed(futures):
+            filename, row_count, file_size = futures[future]
             
             try:
-                response = requests.get(url, timeout=300, verify=False)
-                response.raise_for_status()
-                
-                with open(filepath, "wb") as f:
-                    f.write(response.content)
-                
+                future.result()
                 logger.info(f"Downloaded {filename}: {row_count} rows, {file_size} bytes")
                 downloaded += 1
                 
-            except requests.exceptions.RequestException as e:
+            except urllib3.exceptions.HTTPError as e:
                 logger.error(f"Error downloading {filename}: {e}")
             
             progress.advance(task)
@@ -427,14 +566,41 @@ def download_csv_files(results: list, output_folder: str, logger: logging.Logger
     return downloaded
 
 
-def save_json_result(data: dict, output_folder: str, logger: logging.Logger) -> None:
-    """Save the full JSON response to result.json."""
+def save_json_result(
+    data: dict,
+    output_folder: str,
+    logger: logging.Logger,
+    pretty: bool = False,
+    compress: bool = False,
+    raw: Optional[bytes] = None,
+) -> None:
+    """
+    Save the full JSON response to result.json.
+    
+    The raw response body is written as-is when given; data is only re-encoded
+    (indented if pretty is set, compact otherwise) when pretty is set or raw is missing.
+    With compress, the file is gzipped and saved as result.json.gz.
+    """
     output_path = Path(output_folder)
-    filepath = output_path / "result.json"
+    filepath = output_path / ("result.json.gz" if compress else "result.json")
     
     try:
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if raw is not None and not pretty:
+            payload = raw
+        elif orjson:
+            options = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            payload = orjson.dumps(data, option=options)
+        elif pretty:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        else:
+            payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        # The payload is already fully encoded, so write it in one call
+        if compress:
+            with gzip.open(filepath, "wb", compresslevel=GZIP_LEVEL) as f:
+                f.write(payload)
+        else:
+            filepath.write_bytes(payload)
         
         logger.info(f"Saved JSON response to {filepath}")
         
@@ -445,23 +611,129 @@ def save_json_result(data: dict, output_folder: str, logger: logging.Logger) ->
 
 def _safe_filename(status: str) -> str:
     """Return a filesystem-safe name for ISSUE_STATUS (e.g. for summary-{status}.csv)."""
-    return re.sub(r'[<>:"/\\|?*]', "_", status).strip() or "Unknown"
+    return _UNSAFE_FN.sub("_", status).strip() or "Unknown"
+
 
+def _summarize_csv_file(
+    csv_file: str, issues_fieldnames: list[str], shard: int
+) -> tuple[dict[str, int], dict[str, dict[str, list[int]]], dict[str, str], list[str]]:
+    """
+    Split one csv_*.csv file by ISSUE_STATUS into issues-{ISSUE_STATUS}.csv.part{shard}
+    files and count its issues per status, org and severity.
+
+    Runs in a worker process, so warnings are returned instead of logged.
+    Returns (issue counts per status, severity counts per status and org,
+    part file per safe status name, warnings).
+    """
+    path = Path(csv_file)
+    issue_counts: dict[str, int] = {}
+    by_status: dict[str, dict[str, list[int]]] = {}
+    # Open part files and their writers, keyed by safe status name
+    part_files: dict[str, IO[str]] = {}
+    part_writers: dict = {}
+    warnings: list[str] = []
+    # Raw cell value -> SEV_IDX index (-1 if not counted) / (status, part writer, org counts)
+    severity_cache: dict[str, int] = {}
+    status_cache: dict[str, tuple] = {}
+
+    def get_part_writer(status: str):
+        """Return the part file writer for status, creating the file on first use."""
+        safe_status = _safe_filename(status)
+        writer = part_writers.get(safe_status)
+        if writer is None:
+            part_path = path.parent / f"issues-{safe_status}.csv.part{shard}"
+            f = open(part_path, "w", encoding="utf-8", newline="", buffering=FILE_BUFFER_SIZE)
+            part_files[safe_status] = f
+            writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+            part_writers[safe_status] = writer
+        return writer
 
-def generate_results_review(output_folder: str, logger: logging.Logger) -> dict[str, list[dict]]:
+    try:
+        try:
+            f = open(path, "r", encoding="utf-8", newline="", buffering=FILE_BUFFER_SIZE)
+        except IOError as e:
+            warnings.append(f"Error reading {csv_file}: {e}")
+        else:
+            with f:
+                try:
+                    reader = csv.reader(f)
+                    fields = next(reader, [])
+                    if "ORG_DISPLAY_NAME" not in fields:
+                        warnings.append(f"{path.name}: missing ORG_DISPLAY_NAME column, skipping")
+                    elif "ISSUE_SEVERITY" not in fields:
+                        warnings.append(f"{path.name}: missing ISSUE_SEVERITY column, skipping")
+                    else:
+                        has_status = "ISSUE_STATUS" in fields
+                        if not has_status:
+                            warnings.append(f"{path.name}: missing ISSUE_STATUS column, using 'Unknown'")
+                        org_i = fields.index("ORG_DISPLAY_NAME")
+                        severity_i = fields.index("ISSUE_SEVERITY")
+                        status_i = fields.index("ISSUE_STATUS") if has_status else None
+                        num_fields = len(fields)
+                        # Map this file's columns onto the issues CSV column order when they differ
+                        projection = None
+                        if fields != issues_fieldnames:
+                            projection = [fields.index(name) if name in fields else None for name in issues_fieldnames]
+                        for row in reader:
+                            if not row:
+                                continue
+                            if len(row) < num_fields:
+                                row += [""] * (num_fields - len(row))
+                            org = row[org_i].strip()
+                            raw_status = row[status_i] if has_status else ""
+                            cached_status = status_cache.get(raw_status)
+                            if cached_status is None:
+                                status = (raw_status or "Unknown").strip()
+                                orgs = by_status.setdefault(status, {})
+                                cached_status = status_cache[raw_status] = (status, get_part_writer(status), orgs)
+                            status, writer, orgs = cached_status
+                            if projection is not None:
+                                writer.writerow([row[i] if i is not None else "" for i in projection])
+                            elif len(row) > num_fields:
+                                writer.writerow(row[:num_fields])
+                            else:
+                                writer.writerow(row)
+                            issue_counts[status] = issue_counts.get(status, 0) + 1
+                            if not org:
+                                continue
+                            raw_severity = row[severity_i]
+                            severity_idx = severity_cache.get(raw_severity)
+                            if severity_idx is None:
+                                severity_idx = severity_cache[raw_severity] = SEV_IDX.get(raw_severity.strip().lower(), -1)
+                            if severity_idx >= 0:
+                                counts = orgs.get(org)
+                                if counts is None:
+                                    counts = orgs[org] = [0, 0, 0, 0]
+                                counts[severity_idx] += 1
+                except csv.Error as e:
+                    warnings.append(f"Error reading {csv_file}: {e}")
+    finally:
+        for f in part_files.values():
+            f.close()
+
+    parts = {safe_status: f.name for safe_status, f in part_files.items()}
+    return issue_counts, by_status, parts, warnings
+
+
+def generate_results_review(
+    output_folder: str, logger: logging.Logger, compress: bool = False
+) -> dict[str, list[dict]]:
     """
     Read all csv_*.csv files in the output folder; for each ISSUE_STATUS write
     issues-{ISSUE_STATUS}.csv with all issues of that status, then write
     summary-{ISSUE_STATUS}.csv (ORG_DISPLAY_NAME, CRITICAL, HIGH, MEDIUM, LOW)
     grouped by org with severity counts. Return summary rows per status for display.
+
+    Files are parsed in parallel worker processes and their results merged here.
+    With compress, the issues files are gzipped and saved as issues-{ISSUE_STATUS}.csv.gz.
     """
     output_path = Path(output_folder)
-    # Rows per status (full row dicts for issues-*.csv)
-    rows_by_status: dict[str, list[dict]] = defaultdict(list)
-    # Counts per status -> org -> severity for summary-*.csv
-    by_status: dict[str, dict[str, dict[str, int]]] = defaultdict(
-        lambda: defaultdict(lambda: {"Critical": 0, "High": 0, "Medium": 0, "Low": 0})
-    )
+    # Number of issues written per status to issues-*.csv
+    issue_counts: dict[str, int] = {}
+    # Counts per status -> org -> [CRITICAL, HIGH, MEDIUM, LOW] for summary-*.csv
+    by_status: dict[str, dict[str, list[int]]] = {}
+    # Part files to concatenate, in file order, per safe status name
+    parts_by_status: dict[str, list[str]] = {}
     # Use first file's fieldnames for issues CSV output
     issues_fieldnames: Optional[list[str]] = None
 
@@ -475,76 +747,93 @@ def generate_results_review(output_folder: str, logger: logging.Logger) -> dict[
     for csv_file in csv_files:
         try:
             with open(csv_file, "r", encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f)
-                fields = reader.fieldnames or []
-                if issues_fieldnames is None and fields:
-                    issues_fieldnames = list(fields)
-                if "ORG_DISPLAY_NAME" not in fields:
-                    logger.warning(f"{csv_file.name}: missing ORG_DISPLAY_NAME column, skipping")
-                    continue
-                if "ISSUE_SEVERITY" not in fields:
-                    logger.warning(f"{csv_file.name}: missing ISSUE_SEVERITY column, skipping")
-                    continue
-                has_status = "ISSUE_STATUS" in fields
-                if not has_status:
-                    logger.warning(f"{csv_file.name}: missing ISSUE_STATUS column, using 'Unknown'")
-                for row in reader:
-                    org = (row.get("ORG_DISPLAY_NAME") or "").strip()
-                    severity = (row.get("ISSUE_SEVERITY") or "").strip()
-                    status = (row.get("ISSUE_STATUS") or "Unknown").strip() if has_status else "Unknown"
-                    rows_by_status[status].append(row)
-                    if not org:
-                        continue
-                    severity_lower = severity.lower()
-                    for key in ("Critical", "High", "Medium", "Low"):
-                        if key.lower() == severity_lower:
-                            by_status[status][org][key] += 1
-                            break
-        except (IOError, csv.Error) as e:
-            logger.warning(f"Error reading {csv_file}: {e}")
+                issues_fieldnames = next(csv.reader(f), None)
+        except (IOError, csv.Error):
+            continue  # Reported when the file is summarized
+        if issues_fieldnames:
+            break
 
     if not issues_fieldnames:
         logger.warning("No CSV fieldnames found; skipping issues and summary files")
         return {}
 
-    summary_by_status: dict[str, list[dict]] = {}
-    summary_fieldnames = ["ORG_DISPLAY_NAME", "CRITICAL", "HIGH", "MEDIUM", "LOW"]
+    paths = [str(csv_file) for csv_file in csv_files]
+    shards = range(len(csv_files))
+    workers = min(os.cpu_count() or 1, len(csv_files))
+    try:
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                shard_results = list(executor.map(_summarize_csv_file, paths, repeat(issues_fieldnames), shards))
+        else:
+            shard_results = list(map(_summarize_csv_file, paths, repeat(issues_fieldnames), shards))
+    except IOError as e:
+        logger.error(f"Error writing issues files: {e}")
+        raise
 
-    for status in sorted(rows_by_status.keys()):
-        safe_status = _safe_filename(status)
-        # 1. Write issues-{ISSUE_STATUS}.csv with all issues of that status
-        issues_filename = f"issues-{safe_status}.csv"
-        issues_path = output_path / issues_filename
+    for shard_counts, shard_by_status, parts, warnings in shard_results:
+        for warning in warnings:
+            logger.warning(warning)
+        for status, count in shard_counts.items():
+            issue_counts[status] = issue_counts.get(status, 0) + count
+        for status, orgs in shard_by_status.items():
+            merged = by_status.setdefault(status, {})
+            for org, counts in orgs.items():
+                totals = merged.get(org)
+                if totals is None:
+                    merged[org] = counts
+                else:
+                    for i, count in enumerate(counts):
+                        totals[i] += count
+        for safe_status, part in parts.items():
+            parts_by_status.setdefault(safe_status, []).append(part)
+
+    # 1. Write issues-{ISSUE_STATUS}.csv by concatenating the part files of each shard
+    header = io.StringIO()
+    csv.writer(header, quoting=csv.QUOTE_MINIMAL).writerow(issues_fieldnames)
+    header_bytes = header.getvalue().encode("utf-8")
+    issues_suffix = ".csv.gz" if compress else ".csv"
+    for safe_status, parts in parts_by_status.items():
+        issues_filename = f"issues-{safe_status}{issues_suffix}"
         try:
-            with open(issues_path, "w", encoding="utf-8", newline="") as f:
-                writer = csv.DictWriter(
-                    f, fieldnames=issues_fieldnames, quoting=csv.QUOTE_MINIMAL, extrasaction="ignore"
-                )
-                writer.writeheader()
-                writer.writerows(rows_by_status[status])
-            logger.info(f"Saved {issues_filename} with {len(rows_by_status[status])} issue(s)")
+            if compress:
+                out = gzip.open(output_path / issues_filename, "wb", compresslevel=GZIP_LEVEL)
+            else:
+                out = open(output_path / issues_filename, "wb", buffering=FILE_BUFFER_SIZE)
+            with out:
+                out.write(header_bytes)
+                for part in parts:
+                    with open(part, "rb") as src:
+                        shutil.copyfileobj(src, out, FILE_BUFFER_SIZE)
+                    os.unlink(part)
         except IOError as e:
             logger.error(f"Error writing {issues_filename}: {e}")
             raise
 
+    summary_by_status: dict[str, list[dict]] = {}
+    summary_fieldnames = ["ORG_DISPLAY_NAME", "CRITICAL", "HIGH", "MEDIUM", "LOW"]
+
+    for status in sorted(issue_counts.keys()):
+        safe_status = _safe_filename(status)
+        logger.info(f"Saved issues-{safe_status}{issues_suffix} with {issue_counts[status]} issue(s)")
+
         # 2. Build and write summary-{ISSUE_STATUS}.csv (by org, severity counts)
         by_org = by_status.get(status, {})
         summary_rows = []
         for org in sorted(by_org.keys()):
-            counts = by_org[org]
+            critical, high, medium, low = by_org[org]
             summary_rows.append({
                 "ORG_DISPLAY_NAME": org,
-                "CRITICAL": counts["Critical"],
-                "HIGH": counts["High"],
-                "MEDIUM": counts["Medium"],
-                "LOW": counts["Low"],
+                "CRITICAL": critical,
+                "HIGH": high,
+                "MEDIUM": medium,
+                "LOW": low,
             })
         summary_by_status[status] = summary_rows
 
         summary_filename = f"summary-{safe_status}.csv"
         summary_path = output_path / summary_filename
         try:
-            with open(summary_path, "w", encoding="utf-8", newline="") as f:
+            with open(summary_path, "w", encoding="utf-8", newline="", buffering=FILE_BUFFER_SIZE) as f:
                 writer = csv.DictWriter(
                     f, fieldnames=summary_fieldnames, quoting=csv.QUOTE_MINIMAL
                 )
@@ -564,6 +853,7 @@ def display_results_review_table(summary_by_status: dict[str, list[dict]]) -> No
         console.print("[yellow]No summary data to display.[/yellow]")
         return
 
+
     for status in sorted(summary_by_status.keys()):
         summary_rows = summary_by_status[status]
         if not summary_rows:
@@ -606,9 +896,6 @@ def main() -> int:
         console.print(f"[bold red]Configuration Error:[/bold red]\n{e}")
         return 1
     
-    # Setup logging
-    logger = setup_logging(config.OUTPUT_FOLDER)
-    
     # Print header
     console.print("\n[bold blue]═══════════════════════════════════════════════════════════[/bold blue]")
     console.print("[bold white]         Snyk Export Vulnerabilities from Group            [/bold white]")
@@ -621,6 +908,17 @@ def main() -> int:
     console.print(f"[bold]Output Folder:[/bold] [cyan]{config.OUTPUT_FOLDER}[/cyan]")
     console.print(f"[bold]API URL:[/bold] [cyan]{config.API_URL}[/cyan]")
     console.print()
+
+    step = 1
+
+    # Step 1: Clear the output folder, before the log file is opened in it
+    console.print(f"[bold yellow]Step {step}:[/bold yellow] Clearing output folder...")
+    step += 1
+    clear_output_folder(config.OUTPUT_FOLDER)
+    console.print(f"[green]✓[/green] Output folder cleared\n")
+
+    # Setup logging
+    logger = setup_logging(config.OUTPUT_FOLDER)
     
     logger.info("=" * 60)
     logger.info("Snyk Export Vulnerabilities - Starting")
@@ -632,29 +930,20 @@ def main() -> int:
     logger.info(f"Output Folder: {config.OUTPUT_FOLDER}")
     logger.info(f"API URL: {config.API_URL}")
     logger.info(f"API Version: {config.API_VERSION}")
+
+    session = create_session()
     
     try:
-        # Step 1: Start the export job
-        # Clear the output folder before starting
-
-        output_folder = config.OUTPUT_FOLDER
-
-        step = 1
-
-        console.print(f"[bold yellow]Step {step}:[/bold yellow] Clearing output folder...")
-        step += 1
-        clear_output_folder(output_folder, logger)
-        console.print(f"[green]✓[/green] Output folder cleared\n")
-        
+        # Step 2: Start the export job
         console.print(f"[bold yellow]Step {step}:[/bold yellow] Starting export job...")
         step += 1
-        export_id = start_export(config, logger)
+        export_id = start_export(config, session, logger)
         console.print(f"[green]✓[/green] Export job started with ID: [cyan]{export_id}[/cyan]\n")
 
-        # Step 2: Wait for the export to complete
+        # Step 3: Wait for the export to complete
         console.print(f"[bold yellow]Step {step}:[/bold yellow] Waiting for export to complete...")
         step += 1
-        result_data = wait_for_export(config, export_id, logger)
+        result_data, result_raw = wait_for_export(config, session, export_id, logger)
         
         # Get summary info
         attributes = result_data.get("data", {}).get("attributes", {})
@@ -663,24 +952,32 @@ def main() -> int:
         
         console.print(f"[green]✓[/green] Export completed: [cyan]{total_rows}[/cyan] total rows in [cyan]{len(results)}[/cyan] file(s)\n")
         
-        # Step 3: Save the JSON result
+        # Step 4: Save the JSON result
         console.print(f"[bold yellow]Step {step}:[/bold yellow] Saving JSON result...")
         step += 1
-        save_json_result(result_data, config.OUTPUT_FOLDER, logger)
-        console.print(f"[green]✓[/green] Saved result.json\n")
+        save_json_result(
+            result_data,
+            config.OUTPUT_FOLDER,
+            logger,
+            pretty=config.PRETTY_JSON,
+            compress=config.COMPRESS_OUTPUT,
+            raw=result_raw,
+        )
+        console.print(f"[green]✓[/green] Saved {'result.json.gz' if config.COMPRESS_OUTPUT else 'result.json'}\n")
         
-        # Step 4: Download CSV files
+        # Step 5: Download CSV files
         console.print(f"[bold yellow]Step {step}:[/bold yellow] Downloading CSV files...")
         step += 1
         downloaded = download_csv_files(results, config.OUTPUT_FOLDER, logger)
         console.print(f"[green]✓[/green] Downloaded {downloaded} CSV file(s)\n")
 
-        # Step 5: Generate results review (summary-{status}.csv + one table per status)
+        # Step 6: Generate results review (summary-{status}.csv + one table per status)
         console.print(f"[bold yellow]Step {step}:[/bold yellow] Generating results review...")
         step += 1
-        summary_by_status = generate_results_review(config.OUTPUT_FOLDER, logger)
+        summary_by_status = generate_results_review(config.OUTPUT_FOLDER, logger, compress=config.COMPRESS_OUTPUT)
         num_statuses = len(summary_by_status)
-        console.print(f"[green]✓[/green] Saved {num_statuses} status set(s) (issues-{{status}}.csv + summary-{{status}}.csv)\n")
+        issues_suffix = ".csv.gz" if config.COMPRESS_OUTPUT else ".csv"
+        console.print(f"[green]✓[/green] Saved {num_statuses} status set(s) (issues-{{status}}{issues_suffix} + summary-{{status}}.csv)\n")
         
         # Print summary
         console.print("[bold blue]═══════════════════════════════════════════════════════════[/bold blue]")
@@ -718,6 +1015,9 @@ def main() -> int:
         logger.exception("Script failed with unexpected error")
         return 1
 
+    finally:
+        session.close()
+
 
 if __name__ == "__main__":
     sys.exit(main())